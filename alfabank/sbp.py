@@ -1,22 +1,94 @@
+import asyncio
 import base64
+import contextlib
 import json
 import logging
+import os
+import random
+import socket
+import ssl
 import time
-from typing import Dict, Optional, Any
+from typing import Dict, Iterator, Optional, Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.cookies import RequestsCookieJar, merge_cookies
+from requests.sessions import merge_hooks, merge_setting
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
 from cryptography.hazmat.primitives import serialization, hashes
-from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric import padding, utils
 
 from alfabank.exceptions import AlfaBankSBPClientError
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
+
+    _json_loads = json.loads
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
 logger = logging.getLogger(__name__)
 
 
+class _SSLContextAdapter(HTTPAdapter):
+    """HTTPAdapter, использующий общий SSLContext для всех соединений пула."""
+
+    def __init__(self, ssl_context: ssl.SSLContext, **kwargs: Any) -> None:
+        self.ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs["ssl_context"] = self.ssl_context
+        super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, *args: Any, **kwargs: Any) -> Any:
+        kwargs["ssl_context"] = self.ssl_context
+        return super().proxy_manager_for(*args, **kwargs)
+
+
+_COMMANDS = (
+    "GetQRCd",
+    "GetQRCstatus",
+    "GetQRCreversalData",
+    "QRCreversal",
+    "GetQRCreversalStatus",
+    "GetQRCreversalHistory",
+)
+
+_BOOL_STR = ("false", "true")
+
+_MAX_POLL_INTERVAL = 60
+
+
+def _bool_str(value: Any) -> str:
+    """Преобразует флаг в "true"/"false" для тела запроса.
+
+    Для bool используется таблица; прочие значения (например, строка "false"
+    из формы) приводятся как str(value).lower(), чтобы "false" не стало "true".
+    """
+    if value is True or value is False:
+        return _BOOL_STR[value]
+    return str(value).lower()
+
+
 class AlfaBankSBPClient:
     """Клиент для взаимодействия с API СБП Альфа-Банка.
 
@@ -41,7 +113,8 @@ class AlfaBankSBPClient:
             ca_path: str | bool,
             signing_cert_path: str,
             signing_key_path: str,
-            cert_alias: str
+            cert_alias: str,
+            transport: str = "requests"
     ) -> None:
         """Инициализация клиента.
 
@@ -54,51 +127,280 @@ class AlfaBankSBPClient:
             signing_cert_path: Путь к сертификату для подписи.
             signing_key_path: Путь к приватному ключу для подписи.
             cert_alias: Alias сертификата для заголовка 'key-name'.
+            transport: HTTP-клиент для синхронных запросов: "requests" (по умолчанию)
+                или "httpx" (HTTP/2, требуется extra alfabank[http2]).
         """
+        if transport not in ("requests", "httpx"):
+            raise ValueError(f"Неизвестный transport: {transport}")
+        if transport == "httpx" and httpx is None:
+            raise ImportError("Для transport='httpx' требуется httpx[http2]: pip install alfabank[http2]")
         self.base_url = base_url.rstrip('/')
+        self._post_url = self.base_url + "/"
         self.term_no = term_no
         self.cert_alias = cert_alias
         self.session = requests.Session()
-        self.session.cert = (cert_path, key_path)
-        self.session.verify = ca_path
+        # Сертификат MTLS и CA загружаются в контекст один раз: session.cert не
+        # задаётся, а verify=True не даёт requests повторно читать PEM-файлы
+        # при каждом новом соединении.
+        self.session.verify = bool(ca_path)
+        self._ssl_context = self._build_ssl_context(ca_path)
+        self._ssl_context.load_cert_chain(cert_path, key_path)
+        self._async_session = None
+        self._async_loop = None
+        # Повторяются только ошибки установления TCP-соединения: в этом случае
+        # запрос гарантированно не ушёл на сервер. Ошибки чтения, TLS и прочие
+        # не повторяются, иначе возврат (QRCreversal) может выполниться дважды.
+        adapter = _SSLContextAdapter(
+            self._ssl_context,
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=None, connect=3, read=False, other=0, status=0, backoff_factor=0.3)
+        )
+        self.session.mount("https://", adapter)
+        # Шаблон запроса (метод, URL, постоянные заголовки) готовится один раз.
+        # Состояние session (заголовки, cookies, auth, hooks) накладывается на его
+        # копию при каждой отправке, поэтому изменения session учитываются.
+        self._request_template = requests.Request(
+            "POST",
+            self._post_url,
+            headers={
+                "Content-Type": "application/x-www-form-urlencoded",
+                "key-name": self.cert_alias
+            }
+        ).prepare()
+        self._http_client = None
+        if transport == "httpx":
+            # Отдельный контекст: httpx выставляет в нём ALPN h2, который не
+            # должен попадать в соединения requests и aiohttp.
+            http2_context = self._build_ssl_context(ca_path)
+            http2_context.load_cert_chain(cert_path, key_path)
+            self._http_client = httpx.Client(
+                verify=http2_context,
+                http2=True,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32)
+            )
         self.signing_key_path = signing_key_path
         self._private_key = self._load_private_key()
+        self._padding = padding.PKCS1v15()
+        self._hash = hashes.SHA256()
+        self._prehashed = utils.Prehashed(self._hash)
+        self._sign = self._private_key.sign
+
+    @property
+    def term_no(self) -> str:
+        """Уникальный идентификатор терминала."""
+        return self._term_no
+
+    @term_no.setter
+    def term_no(self, value: str) -> None:
+        # Префиксы тела запроса содержат TermNo, поэтому пересобираются при смене значения.
+        self._term_no = value
+        self._prefixes = {command: self._build_prefix(command) for command in _COMMANDS}
+
+    @staticmethod
+    def _build_ssl_context(ca_path: str | bool) -> ssl.SSLContext:
+        """Создаёт SSLContext с проверкой сервера по CA, общий для всех соединений.
+
+        CA загружается при создании контекста, клиентский сертификат MTLS
+        добавляется в него вызывающим кодом; PEM-файлы читаются один раз.
+        """
+        if ca_path is False:
+            ctx = ssl.create_default_context()
+            ctx.check_hostname = False
+            ctx.verify_mode = ssl.CERT_NONE
+        elif ca_path is True:
+            ctx = ssl.create_default_context(cafile=requests.certs.where())
+        elif os.path.isdir(ca_path):
+            ctx = ssl.create_default_context(capath=ca_path)
+        else:
+            ctx = ssl.create_default_context(cafile=ca_path)
+        return ctx
 
     def _load_private_key(self) -> Any:
-        """Загружает приватный ключ для подписи запросов."""
+        """Загружает приватный ключ для подписи запросов.
+
+        Ключ загружается один раз; OpenSSL хранит его вместе с CRT-параметрами
+        (dmp1, dmq1, iqmp) из PEM, поэтому при подписи они не пересчитываются.
+        """
         with open(self.signing_key_path, "rb") as key_file:
             return serialization.load_pem_private_key(key_file.read(), password=None)
 
-    def _sign_data(self, data: bytes) -> bytes:
-        """Подписывает данные SHA256 с использованием приватного ключа."""
-        return base64.b64encode(self._private_key.sign(data, padding.PKCS1v15(), hashes.SHA256()))
+    def _sign_data(self, data: bytes) -> str:
+        """Подписывает данные SHA256 с использованием приватного ключа.
 
-    def _build_request_data(self, command: str, optional_params: Dict[str, Any]) -> Dict[str, Any]:
-        """Формирует тело запроса с обязательными и опциональными параметрами."""
-        return {"command": command, "TermNo": self.term_no, **optional_params}
+        Подпись выполняется через OpenSSL (libcrypto) из состава cryptography:
+        RSA с CRT и аппаратное ускорение SHA-256 используются автоматически.
+        """
+        hasher = hashes.Hash(self._hash)
+        hasher.update(data)
+        return base64.b64encode(self._sign(hasher.finalize(), self._padding, self._prehashed)).decode("ascii")
 
-    def _send_request(self, data: Dict[str, Any], endpoint: str = "") -> Dict[str, Any]:
-        """Отправляет POST-запрос с MTLS и подписью."""
-        data = json.dumps(data, ensure_ascii=False).encode('utf-8')
-        headers = {
+    def _build_prefix(self, command: str) -> bytes:
+        """Сериализует обязательную часть тела запроса без закрывающей скобки."""
+        return _json_dumps({"command": command, "TermNo": self.term_no})[:-1]
+
+    def _build_request_data(self, command: str, optional_params: Dict[str, Any]) -> bytes:
+        """Формирует JSON-тело запроса с обязательными и опциональными параметрами.
+
+        Обязательная часть ("command", "TermNo") сериализуется один раз при
+        создании клиента; при каждом вызове сериализуются только опциональные параметры.
+        """
+        prefix = self._prefixes.get(command) or self._build_prefix(command)
+        rest = _json_dumps(self._drop_none(optional_params))
+        if rest == b"{}":
+            return prefix + b"}"
+        return prefix + b"," + rest[1:]
+
+    @staticmethod
+    def _drop_none(params: Dict[str, Any]) -> Dict[str, Any]:
+        """Удаляет параметры со значением None."""
+        return {k: v for k, v in params.items() if v is not None}
+
+    def _build_headers(self, data: bytes) -> Dict[str, Any]:
+        """Подписывает тело запроса и формирует заголовки."""
+        return {
             "Content-Type": "application/x-www-form-urlencoded",
             "Authorization": self._sign_data(data),
             "key-name": self.cert_alias
         }
-        logger.debug(f"Запрос: URL={self.base_url}/{endpoint}, Тело={data}, Заголовки={headers}")
 
-        response = self.session.post(
-            f"{self.base_url}/{endpoint}",
-            headers=headers,
-            data=data,
-        )
-        response.raise_for_status()
-        result = response.json()
+    @staticmethod
+    def _check_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Проверяет код ошибки в ответе API."""
         if result.get("ErrorCode") != 0:
             message = result.get("message", None).replace('%u', '\\u').encode().decode('unicode_escape') or "Неизвестная ошибка"
             raise AlfaBankSBPClientError(result.get("ErrorCode"), message)
         return result
 
+    def _send_request(self, data: bytes, endpoint: str = "") -> Dict[str, Any]:
+        """Отправляет POST-запрос с MTLS и подписью."""
+        if self._http_client is not None:
+            return self._send_request_httpx(data, endpoint)
+
+        request = self._request_template.copy()
+        if endpoint:
+            request.prepare_url(self._post_url + endpoint, None)
+        request.headers = merge_setting(request.headers, self.session.headers, dict_class=CaseInsensitiveDict)
+        request.prepare_cookies(merge_cookies(RequestsCookieJar(), self.session.cookies))
+        request.prepare_body(data, None)
+        if self.session.auth is not None:
+            request.prepare_auth(self.session.auth)
+        request.hooks = merge_hooks(request.hooks, self.session.hooks)
+        request.headers["Authorization"] = self._sign_data(data)
+        logger.debug("Запрос: URL=%s, Тело=%s, Заголовки=%s", request.url, data, request.headers)
+
+        response = self.session.send(request)
+        response.raise_for_status()
+        return self._check_result(_json_loads(response.content))
+
+    def _send_request_httpx(self, data: bytes, endpoint: str = "") -> Dict[str, Any]:
+        """Отправляет POST-запрос с MTLS и подписью через httpx (HTTP/2).
+
+        Ответы 4xx/5xx поднимают requests.HTTPError, как и транспорт requests.
+        """
+        headers = self._build_headers(data)
+        url = self._post_url + endpoint if endpoint else self._post_url
+        logger.debug("Запрос: URL=%s, Тело=%s, Заголовки=%s", url, data, headers)
+
+        response = self._http_client.post(url, headers=headers, content=data)
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise requests.HTTPError(str(e), response=response) from e
+        return self._check_result(_json_loads(response.content))
+
+    def _get_async_session(self) -> "aiohttp.ClientSession":
+        """Возвращает aiohttp-сессию текущего event loop, создавая её при необходимости.
+
+        Сессия привязана к loop, в котором создана; при вызове из другого loop
+        (например, при повторном asyncio.run) создаётся новая сессия.
+        """
+        if aiohttp is None:
+            raise ImportError("Для асинхронных методов требуется aiohttp: pip install alfabank[async]")
+        loop = asyncio.get_running_loop()
+        if self._async_session is not None and self._async_loop is not loop:
+            self._detach_async_session()
+        if self._async_session is None or self._async_session.closed:
+            self._async_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(ssl=self._ssl_context, limit=64)
+            )
+            self._async_loop = loop
+        return self._async_session
+
+    def _detach_async_session(self) -> None:
+        """Отвязывает сессию другого event loop и закрывает её соединения.
+
+        Этот loop может быть уже закрыт (например, после asyncio.run), поэтому
+        соединения пула завершаются через shutdown сокетов, без обращения к loop.
+        """
+        connector = self._async_session.connector
+        self._async_session.detach()
+        self._async_session = None
+        self._async_loop = None
+        if connector is None:
+            return
+        protocols = [proto for conns in connector._conns.values() for proto, _ in conns]
+        protocols.extend(connector._acquired)
+        for proto in protocols:
+            sock = proto.transport.get_extra_info("socket") if proto.transport is not None else None
+            if sock is not None:
+                with contextlib.suppress(OSError):
+                    sock.shutdown(socket.SHUT_RDWR)
+        connector._close()
+
+    async def _send_request_async(self, data: bytes, endpoint: str = "") -> Dict[str, Any]:
+        """Асинхронно отправляет POST-запрос с MTLS и подписью.
+
+        Ответы 4xx/5xx поднимают aiohttp.ClientResponseError.
+        """
+        headers = self._build_headers(data)
+        url = self._post_url + endpoint if endpoint else self._post_url
+        logger.debug("Запрос: URL=%s, Тело=%s, Заголовки=%s", url, data, headers)
+
+        async with self._get_async_session().post(
+                url,
+                headers=headers,
+                data=data,
+        ) as response:
+            response.raise_for_status()
+            content = await response.read()
+        return self._check_result(_json_loads(content))
+
+    def close(self) -> None:
+        """Закрывает HTTP-соединения синхронного транспорта (requests и httpx)."""
+        if self._http_client is not None:
+            self._http_client.close()
+        self.session.close()
+
+    def __enter__(self) -> "AlfaBankSBPClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def aclose(self) -> None:
+        """Закрывает aiohttp-сессию, используемую асинхронными методами.
+
+        Вызывать следует в том же event loop, в котором выполнялись запросы
+        (или использовать ``async with client``): только так сокеты пула
+        закрываются полностью. Сессия чужого loop лишь отвязывается, а её
+        соединения завершаются через shutdown.
+        """
+        if self._async_session is None:
+            return
+        if self._async_loop is not asyncio.get_running_loop():
+            self._detach_async_session()
+            return
+        await self._async_session.close()
+        self._async_session = None
+        self._async_loop = None
+
+    async def __aenter__(self) -> "AlfaBankSBPClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
     def get_qr_code(
             self,
             amount: int,
@@ -152,13 +454,14 @@ class AlfaBankSBPClient:
             "subscriptionServiceId": subscription_service_id,
             "subscriptionServiceName": subscription_service_name
         }
-        if any([notification_url, sender_fio, sender_id, sender_bank_bic]):
-            params["queryData"] = {
-                "notificationUrl": notification_url,
-                "SenderFIO": sender_fio,
-                "SenderID": sender_id,
-                "SenderBankBIC": sender_bank_bic
-            }
+        query_data = self._drop_none({
+            "notificationUrl": notification_url,
+            "SenderFIO": sender_fio,
+            "SenderID": sender_id,
+            "SenderBankBIC": sender_bank_bic
+        })
+        if query_data:
+            params["queryData"] = query_data
         return self._send_request(self._build_request_data("GetQRCd", params))
 
     def get_qr_status(
@@ -212,7 +515,7 @@ class AlfaBankSBPClient:
             "amount": str(amount) if amount is not None else None,
             "currency": currency,
             "messageID": message_id,
-            "ReturnRestAmount": str(return_rest_amount).lower() if return_rest_amount is not None else None
+            "ReturnRestAmount": _bool_str(return_rest_amount) if return_rest_amount is not None else None
         }
         return self._send_request(self._build_request_data("GetQRCreversalData", params))
 
@@ -252,9 +555,10 @@ class AlfaBankSBPClient:
             "amount": str(amount) if amount is not None else None,
             "currency": currency,
             "messageID": message_id,
-            "ReturnRestAmount": str(return_rest_amount).lower() if return_rest_amount is not None else None,
-            "queryData": {"notificationUrl": notification_url}
+            "ReturnRestAmount": _bool_str(return_rest_amount) if return_rest_amount is not None else None
         }
+        if notification_url is not None:
+            params["queryData"] = {"notificationUrl": notification_url}
         return self._send_request(self._build_request_data("QRCreversal", params))
 
     def get_reversal_status(
@@ -294,6 +598,34 @@ class AlfaBankSBPClient:
         """
         return self._send_request(self._build_request_data("GetQRCreversalHistory", {"payrrn": payrrn}))
 
+    @staticmethod
+    def _poll_delays(max_attempts: int, interval_seconds: float) -> Iterator[float]:
+        """Выдаёт паузу перед каждой попыткой опроса (перед первой — 0).
+
+        Интервал начинается с max(interval_seconds, 10), растёт в 1.5 раза после
+        каждой попытки до потолка max(60, interval_seconds) и получает джиттер до 10%.
+        Отсчёт ведётся от начала предыдущей попытки по монотонным часам,
+        поэтому время самого запроса не добавляется к интервалу.
+        """
+        delay = max(interval_seconds, 10)  # Минимум 10 секунд
+        ceiling = max(_MAX_POLL_INTERVAL, interval_seconds)
+        pause = 0.0
+        for _ in range(max_attempts):
+            started = time.monotonic() + pause
+            yield pause
+            pause = max(0.0, started + delay + random.uniform(0, delay * 0.1) - time.monotonic())
+            delay = min(delay * 1.5, ceiling)
+
+    @staticmethod
+    def _is_final_status(result: Dict[str, Any], attempt: int) -> bool:
+        """Проверяет, является ли статус QR-кода финальным."""
+        status = result.get("status")
+        if status in ["ACWP", "RJCT"]:
+            logger.debug("Финальный статус QR-кода: %s", status)
+            return True
+        logger.debug("Промежуточный статус: %s, попытка %s", status, attempt + 1)
+        return False
+
     def poll_qr_status(
             self,
             qrc_id: Optional[str] = None,
@@ -307,20 +639,54 @@ class AlfaBankSBPClient:
             qrc_id: Идентификатор QR-кода (32 символа, требуется, если не указан payrrn).
             payrrn: Референсный идентификатор запроса (12 цифр, требуется, если не указан qrc_id).
             max_attempts: Максимальное количество попыток опроса (по умолчанию 10).
-            interval_seconds: Интервал между попытками в секундах (не менее 10, по умолчанию 10).
+            interval_seconds: Начальный интервал между попытками в секундах (не менее 10, по умолчанию 10).
+                Интервал растёт в 1.5 раза после каждой попытки, но не выше 60 секунд
+                (или interval_seconds, если он больше 60).
         """
         if not (qrc_id or payrrn):
-            raise AlfaBankSBPClientError("Требуется qrcId или payrrn")
+            raise AlfaBankSBPClientError("-1", "Требуется qrcId или payrrn")
 
-        for attempt in range(max_attempts):
+        for attempt, pause in enumerate(self._poll_delays(max_attempts, interval_seconds)):
+            if pause:
+                time.sleep(pause)
             try:
                 result = self.get_qr_status(qrc_id, payrrn)
-                status = result.get("status")
-                if status in ["ACWP", "RJCT"]:
-                    logger.debug(f"Финальный статус QR-кода: {status}")
+                if self._is_final_status(result, attempt):
+                    return result
+            except AlfaBankSBPClientError as e:
+                logger.debug("Попытка %s не удалась: %s", attempt + 1, e)
+
+    async def poll_qr_status_async(
+            self,
+            qrc_id: Optional[str] = None,
+            payrrn: Optional[str] = None,
+            max_attempts: int = 10,
+            interval_seconds: int = 10
+    ) -> Dict[str, Any] | None:
+        """Асинхронно опрашивает статус QR-кода до получения финального состояния.
+
+        Аналог poll_qr_status, не блокирующий поток: несколько опросов могут
+        выполняться в одном event loop через общий пул соединений aiohttp.
+
+        Args:
+            qrc_id: Идентификатор QR-кода (32 символа, требуется, если не указан payrrn).
+            payrrn: Референсный идентификатор запроса (12 цифр, требуется, если не указан qrc_id).
+            max_attempts: Максимальное количество попыток опроса (по умолчанию 10).
+            interval_seconds: Начальный интервал между попытками в секундах (не менее 10, по умолчанию 10).
+                Интервал растёт в 1.5 раза после каждой попытки, но не выше 60 секунд
+                (или interval_seconds, если он больше 60).
+        """
+        if not (qrc_id or payrrn):
+            raise AlfaBankSBPClientError("-1", "Требуется qrcId или payrrn")
+
+        for attempt, pause in enumerate(self._poll_delays(max_attempts, interval_seconds)):
+            if pause:
+                await asyncio.sleep(pause)
+            try:
+                result = await self._send_request_async(
+                    self._build_request_data("GetQRCstatus", {"qrcId": qrc_id, "payrrn": payrrn})
+                )
+                if self._is_final_status(result, attempt):
                     return result
-                logger.debug(f"Промежуточный статус: {status}, попытка {attempt + 1}")
-                time.sleep(max(interval_seconds, 10))  # Минимум 10 секунд
             except AlfaBankSBPClientError as e:
-                logger.debug(f"Попытка {attempt + 1} не удалась: {e}")
-                time.sleep(max(interval_seconds, 10))
+                logger.debug("Попытка %s не удалась: %s", attempt + 1, e)